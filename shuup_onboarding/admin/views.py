@@ -14,6 +14,7 @@ from shuup.admin.supplier_provider import get_supplier
 
 from shuup_onboarding.base import Onboarding
 from shuup_onboarding.onboard import get_onboarding_provider, OnboardingContext
+from shuup_onboarding.prepare import get_render_context, prepare_render_context
 from shuup_onboarding.storage import OnboardingSessionStorage
 
 
@@ -34,18 +35,31 @@ class AdminOnboardingView(FormView):
             onboarding_process_id,
             onboarding_context
         )   # type: Onboarding
-        self.current_step = self.onboarding.get_current_step()
+        self._load_pending_steps()
 
         if not self.current_step:
             return HttpResponseRedirect(self.get_success_url())
 
         return super().dispatch(request, *args, **kwargs)
 
+    def _load_pending_steps(self):
+        self.pending_steps = self.onboarding.get_pending_steps()
+        self.current_step = (self.pending_steps[0] if self.pending_steps else None)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["request"] = self.request
         context["onboarding"] = self.onboarding
         context["onboard_step"] = self.current_step
+
+        process_id = self.kwargs["process_id"]
+        session_key = self.request.session.session_key
+        context["onboard_step_context"] = get_render_context(process_id, session_key, self.current_step)
+
+        # prepare the next step while the user is busy with the current one
+        if len(self.pending_steps) > 1 and self.pending_steps[1].prepare_render_context:
+            prepare_render_context(process_id, session_key, self.pending_steps[1])
+
         return context
 
     def get_form(self, form_class=None):
@@ -63,7 +77,7 @@ class AdminOnboardingView(FormView):
 
     def _check_next_step(self, request, *args, **kwargs):
         # no more steps, it means we are done with this onboarding
-        self.current_step = self.onboarding.get_current_step()
+        self._load_pending_steps()
 
         if not self.current_step:
             return HttpResponseRedirect(self.get_success_url())
@@ -6,6 +6,7 @@
 # This source code is licensed under the OSL version 3.0 found in the
 # LICENSE file in the root directory of this source tree.
 import shuup.apps
+from django.conf import settings
 
 
 class AppConfig(shuup.apps.AppConfig):
@@ -19,3 +20,8 @@ class AppConfig(shuup.apps.AppConfig):
             "shuup_onboarding.admin.OnboardingAdmin"
         ]
     }
+
+    def ready(self):
+        if settings.SHUUP_ONBOARDING_WARM_UP_ON_READY:
+            from shuup_onboarding.warmup import warm_up_onboarding
+            warm_up_onboarding()
@@ -59,6 +59,16 @@ class AbstractOnboardingStorage:
     def clear(self):
         raise NotImplementedError()
 
+    def get_revision(self) -> int:
+        """
+        Returns a number that changes every time the storage data changes.
+
+        Only changes made through the storage are tracked: mutating a stored
+        value in place, e.g. `storage["address"]["city"] = "x"`, doesn't change
+        the revision. Set the value again to notify the change.
+        """
+        raise NotImplementedError()
+
 
 class AbstractOnboardingContext:
     storage = None      # type: AbstractOnboardingStorage
@@ -84,6 +94,10 @@ class OnboardingStep:
     template_name = ""      # type: str
     js_template_name = ""   # type: str
 
+    # Whether the render context can be prepared in background
+    # while the user is still on the previous step
+    prepare_render_context = False  # type: bool
+
     def __init__(self, context: AbstractOnboardingContext):
         self.context = context
 
@@ -147,6 +161,17 @@ class OnboardingStep:
         """
         return {}
 
+    def get_render_context_key(self) -> Any:
+        """
+        Returns a hashable value that identifies the data the render context depends on.
+
+        A render context prepared in background is only used when this value
+        didn't change since it was prepared. By default, any change to the storage
+        discards the prepared context. Override this to narrow it to the data
+        the render context actually reads, e.g. `return self.context.storage.get("country")`.
+        """
+        return self.context.storage.get_revision()
+
     def save(self, form):
         """
         Save the data form the form as it is valid.
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections
+from django.utils import timezone, translation
+from shuup.core.models import Shop, Supplier
+
+from shuup_onboarding.base import OnboardingStep
+from shuup_onboarding.onboard import OnboardingContext
+from shuup_onboarding.storage import OnboardingMemoryStorage
+
+LOG = logging.getLogger(__name__)
+
+_executor = None    # type: Optional[ThreadPoolExecutor]
+_pending = OrderedDict()    # type: OrderedDict[Tuple[str, str, str], Tuple[str, Future]]
+# reentrant, as cancelling a future runs its callbacks right away
+_lock = threading.RLock()
+
+
+class _PrepareExecutor(ThreadPoolExecutor):
+    def submit(self, fn, *args, **kwargs):
+        return super().submit(_close_connections_after, fn, *args, **kwargs)
+
+
+def _close_connections_after(fn, *args, **kwargs):
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        # database connections are per thread, don't leave them open in the pool
+        connections.close_all()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = _PrepareExecutor(
+                max_workers=settings.SHUUP_ONBOARDING_PREPARE_MAX_WORKERS,
+                thread_name_prefix="onboarding-prepare"
+            )
+        return _executor
+
+
+def _get_cache_key(session_key: str, process_id: str, step: OnboardingStep, render_context_key: Any) -> str:
+    key = repr((session_key, process_id, step.identifier, render_context_key))
+    return "shuup_onboarding_prepared:{}".format(hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+
+def _forget(pending_key: Tuple[str, str, str], future: Future):
+    with _lock:
+        if pending_key in _pending and _pending[pending_key][1] is future:
+            del _pending[pending_key]
+
+
+def _get_object(model, pk):
+    if pk is not None:
+        return model.objects.filter(pk=pk).first()
+
+
+def _prepare_render_context(cache_key: str, step_class: type, snapshot: Dict):
+    try:
+        context = OnboardingContext(
+            storage=OnboardingMemoryStorage(snapshot["storage_data"], snapshot["storage_revision"]),
+            shop=_get_object(Shop, snapshot["shop_id"]),
+            supplier=_get_object(Supplier, snapshot["supplier_id"]),
+            user=_get_object(get_user_model(), snapshot["user_id"])
+        )
+        # render the context in the same language and timezone of the request
+        with translation.override(snapshot["language"]), timezone.override(snapshot["timezone"]):
+            render_context = step_class(context).get_render_context()
+        cache.set(cache_key, render_context, settings.SHUUP_ONBOARDING_PREPARED_RENDER_CONTEXT_TIMEOUT)
+    except Exception:
+        LOG.exception("Failed to prepare the render context of step %s", step_class.identifier)
+
+
+def prepare_render_context(process_id: str, session_key: str, step: OnboardingStep):
+    """
+    Start computing the render context of the given step in background.
+
+    The result is stored in the cache, to be used by `get_render_context`
+    in the next requests. Does nothing when the step doesn't allow
+    preparing its render context.
+    """
+    if not step.prepare_render_context or not session_key:
+        return
+
+    pending_key = (session_key, process_id, step.identifier)
+    cache_key = _get_cache_key(session_key, process_id, step, step.get_render_context_key())
+
+    with _lock:
+        pending = _pending.pop(pending_key, None)
+        if pending and pending[0] == cache_key:
+            _pending[pending_key] = pending
+            return
+        if pending:
+            pending[1].cancel()
+
+    # give the worker a copy of the step context, the request objects
+    # are still being used by the request thread
+    onboarding_context = step.context
+    snapshot = dict(
+        storage_data=copy.deepcopy(dict(onboarding_context.storage.items())),
+        storage_revision=onboarding_context.storage.get_revision(),
+        shop_id=onboarding_context.shop.pk if onboarding_context.shop else None,
+        supplier_id=onboarding_context.supplier.pk if onboarding_context.supplier else None,
+        user_id=onboarding_context.user.pk if onboarding_context.user else None,
+        language=translation.get_language(),
+        timezone=timezone.get_current_timezone()
+    )
+    future = _get_executor().submit(_prepare_render_context, cache_key, type(step), snapshot)
+
+    with _lock:
+        _pending[pending_key] = (cache_key, future)
+        while len(_pending) > settings.SHUUP_ONBOARDING_PREPARE_QUEUE_LIMIT:
+            _, (_, evicted) = _pending.popitem(last=False)
+            evicted.cancel()
+
+    future.add_done_callback(partial(_forget, pending_key))
+
+
+def get_render_context(process_id: str, session_key: str, step: OnboardingStep) -> Dict:
+    """
+    Returns the render context of the given step.
+
+    Uses the render context prepared in background when it is ready
+    and still valid, otherwise computes it now.
+    """
+    if not step.prepare_render_context or not session_key:
+        return step.get_render_context()
+
+    # not ready yet or prepared for other data, it is faster to compute it now
+    with _lock:
+        pending = _pending.pop((session_key, process_id, step.identifier), None)
+    if pending:
+        pending[1].cancel()
+
+    cache_key = _get_cache_key(session_key, process_id, step, step.get_render_context_key())
+    render_context = cache.get(cache_key)
+    if render_context is not None:
+        cache.delete(cache_key)
+        return render_context
+
+    return step.get_render_context()
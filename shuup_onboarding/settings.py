@@ -22,3 +22,32 @@ SHUUP_ONBOARDING_DEFAULT_SUCCESS_URL = "shuup_admin:dashboard"
 #:  SHUUP_ONBOARDING_MIDDLEWARE_IGNORE_VIEWS = ["shuup_admin:myapp.my_url"]
 #:
 SHUUP_ONBOARDING_MIDDLEWARE_IGNORE_VIEWS = []
+
+
+#: Whether to load all onboarding processes and pre-compile their templates
+#: when the app is ready, to save the first request from doing it.
+#: Broken step definitions will make the startup fail.
+#:
+#: Prefer calling `shuup_onboarding.warmup.warm_up_onboarding`
+#: from a pre-fork server hook when using a preloaded app.
+#:
+SHUUP_ONBOARDING_WARM_UP_ON_READY = False
+
+
+#: Number of threads used to prepare, in background, the render context
+#: of the steps that allow it through `OnboardingStep.prepare_render_context`
+#:
+SHUUP_ONBOARDING_PREPARE_MAX_WORKERS = 2
+
+#: Maximum number of render contexts waiting to be prepared, per process.
+#: The oldest ones are cancelled when the limit is reached.
+#:
+SHUUP_ONBOARDING_PREPARE_QUEUE_LIMIT = 50
+
+#: Seconds to keep a prepared render context in the default cache.
+#:
+#: The cache is used to share the prepared render contexts
+#: between the server processes, so it must not be a local memory
+#: cache when running multiple workers.
+#:
+SHUUP_ONBOARDING_PREPARED_RENDER_CONTEXT_TIMEOUT = 300
@@ -5,7 +5,7 @@
 #
 # This source code is licensed under the OSL version 3.0 found in the
 # LICENSE file in the root directory of this source tree.
-from typing import Any
+from typing import Any, Dict
 
 from django.contrib.sessions.backends.base import SessionBase
 
@@ -22,29 +22,36 @@ class OnboardingSessionStorage(AbstractOnboardingStorage):
     def __init__(self, process_id: str, session: SessionBase):
         self._session = session
         self._session_key = "onboarding_{}".format(process_id)
+        self._revision_key = "onboarding_{}_revision".format(process_id)
         if self._session_key not in self._session:
             self._session[self._session_key] = {}
 
+    def _changed(self):
+        self._session[self._revision_key] = self.get_revision() + 1
+        self._session.modified = True
+
     def __getitem__(self, key: str) -> Any:
         return self._session[self._session_key].get(key)
 
     def __setitem__(self, key: str, value):
         self._session[self._session_key][key] = value
-        self._session.modified = True
+        self._changed()
 
     def __contains__(self, key):
         return key in self._session[self._session_key]
 
     def __delitem__(self, key):
         del self._session[self._session_key][key]
-        self._session.modified = True
+        self._changed()
 
     def get(self, key, default=None):
         return self._session[self._session_key].get(key, default)
 
     def pop(self, key, default=None):
-        val = self._session[self._session_key].pop(key, default)
-        self._session.modified = True
+        if key not in self:
+            return default
+        val = self._session[self._session_key].pop(key)
+        self._changed()
         return val
 
     def keys(self):
@@ -58,4 +65,61 @@ class OnboardingSessionStorage(AbstractOnboardingStorage):
 
     def clear(self):
         self._session[self._session_key] = {}
-        self._session.modified = True
+        self._changed()
+
+    def get_revision(self) -> int:
+        return self._session.get(self._revision_key, 0)
+
+
+class OnboardingMemoryStorage(AbstractOnboardingStorage):
+    """
+    Storage that keeps the onboarding data in memory.
+
+    Used to give a detached copy of another storage data
+    to code running outside of the request.
+    """
+    _data = None        # type: Dict[str, Any]
+    _revision = 0       # type: int
+
+    def __init__(self, data: Dict[str, Any] = None, revision: int = 0):
+        self._data = dict(data or {})
+        self._revision = revision
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data.get(key)
+
+    def __setitem__(self, key: str, value):
+        self._data[key] = value
+        self._revision += 1
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._revision += 1
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def pop(self, key, default=None):
+        if key not in self._data:
+            return default
+        self._revision += 1
+        return self._data.pop(key)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self):
+        self._data = {}
+        self._revision += 1
+
+    def get_revision(self) -> int:
+        return self._revision
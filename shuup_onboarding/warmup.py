@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+import logging
+import time
+from typing import Dict, Iterable, List
+
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.template import engines
+from jinja2 import TemplateError
+from shuup.apps import AppConfig
+from shuup.apps.provides import get_provide_objects
+
+from shuup_onboarding.base import OnboardingStep
+from shuup_onboarding.onboard import get_onboarding_provider
+
+LOG = logging.getLogger(__name__)
+
+ONBOARDING_PROCESS_PROVIDES_PREFIX = "onboarding_process:"
+
+ONBOARDING_TEMPLATES = [
+    "shuup_onboarding/admin/onboard.jinja",
+    "shuup_onboarding/admin/macros.jinja",
+]
+
+
+def get_onboarding_process_categories() -> List[str]:
+    """
+    Returns all the `onboarding_process:*` provides categories
+    declared by the installed Shuup apps
+    """
+    categories = []
+    for app_config in apps.get_app_configs():
+        if not isinstance(app_config, AppConfig):
+            continue
+
+        for category in app_config.provides.keys():
+            if category.startswith(ONBOARDING_PROCESS_PROVIDES_PREFIX) and category not in categories:
+                categories.append(category)
+
+    return categories
+
+
+def _validate_step(category: str, onboarding_step) -> List[str]:
+    """
+    Check the step class definition and return the templates it uses
+    """
+    if not (isinstance(onboarding_step, type) and issubclass(onboarding_step, OnboardingStep)):
+        raise ImproperlyConfigured(
+            "Error! `{}` provided by `{}` is not an `OnboardingStep` subclass.".format(onboarding_step, category)
+        )
+
+    if not onboarding_step.identifier:
+        raise ImproperlyConfigured(
+            "Error! `{}` provided by `{}` has no identifier.".format(onboarding_step.__name__, category)
+        )
+
+    if not onboarding_step.template_name:
+        raise ImproperlyConfigured(
+            "Error! `{}` provided by `{}` has no template_name.".format(onboarding_step.__name__, category)
+        )
+
+    templates = [onboarding_step.template_name]
+    if onboarding_step.js_template_name:
+        templates.append(onboarding_step.js_template_name)
+    return templates
+
+
+def _compile_templates(template_names: Iterable[str]):
+    """
+    Compile the templates in every Jinja environment, filling both
+    the environment template cache and its bytecode cache, if configured
+    """
+    jinja_envs = [engine.env for engine in engines.all() if hasattr(engine, "env")]
+    if not jinja_envs:
+        raise ImproperlyConfigured("Error! No Jinja template engine configured to warm up onboarding templates.")
+
+    for template_name in template_names:
+        for env in jinja_envs:
+            try:
+                env.get_template(template_name)
+            except TemplateError as exc:
+                raise ImproperlyConfigured(
+                    "Error! Failed to compile onboarding template `{}`: {}".format(template_name, exc)
+                ) from exc
+
+
+def warm_up_onboarding() -> Dict[str, int]:
+    """
+    Resolve all onboarding processes and pre-compile their templates.
+
+    It loads the onboarding provider and every step class declared
+    in `onboarding_process:*` provides, validates the step definitions
+    and compiles the templates they use, so the first request served
+    doesn't need to pay for it.
+
+    Raises `ImproperlyConfigured` at the first broken step definition.
+
+    This can be called from `AppConfig.ready()`, through the
+    `SHUUP_ONBOARDING_WARM_UP_ON_READY` setting, or from a
+    pre-fork server hook.
+
+    Returns a dictionary mapping each process id to its number of steps.
+    """
+    start = time.monotonic()
+    get_onboarding_provider()
+
+    processes = {}
+    templates = list(ONBOARDING_TEMPLATES)
+
+    for category in get_onboarding_process_categories():
+        try:
+            onboarding_steps = list(get_provide_objects(category))
+        except Exception as exc:
+            raise ImproperlyConfigured(
+                "Error! Failed to load the steps provided by `{}`: {}".format(category, exc)
+            ) from exc
+
+        for onboarding_step in onboarding_steps:
+            for template_name in _validate_step(category, onboarding_step):
+                if template_name not in templates:
+                    templates.append(template_name)
+
+        processes[category[len(ONBOARDING_PROCESS_PROVIDES_PREFIX):]] = len(onboarding_steps)
+
+    _compile_templates(templates)
+
+    LOG.info(
+        "Onboarding warm-up finished in %.1f ms (%d processes, %d steps, %d templates)",
+        (time.monotonic() - start) * 1000,
+        len(processes),
+        sum(processes.values()),
+        len(templates)
+    )
+    return processes
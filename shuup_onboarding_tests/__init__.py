@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+default_app_config = __name__ + ".apps.AppConfig"
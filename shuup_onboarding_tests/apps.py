@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+import shuup.apps
+
+
+class AppConfig(shuup.apps.AppConfig):
+    name = "shuup_onboarding_tests"
+    label = "shuup_onboarding_tests"
+    # the `settings` module of this package holds the test project settings,
+    # not default settings of the app
+    default_settings_module = ".app_settings"
+    provides = {
+        "onboarding_process:test_process": [
+            "shuup_onboarding_tests.onboarding_steps.InfoStep",
+            "shuup_onboarding_tests.onboarding_steps.ExtraStep",
+        ]
+    }
@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+from shuup.apps.provides import clear_provides_cache
+
+
+@pytest.fixture(autouse=True)
+def clean_provides():
+    # `override_provides` leaves empty provides behind for categories that were never loaded
+    yield
+    clear_provides_cache()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+from django import forms
+
+from shuup_onboarding.base import OnboardingStep
+
+
+class InfoForm(forms.Form):
+    info = forms.CharField()
+
+
+class InfoStep(OnboardingStep):
+    identifier = "info"
+    title = "Info"
+    priority = 2
+    template_name = "shuup_onboarding_tests/step.jinja"
+
+    def can_skip(self):
+        return False
+
+    def is_done(self):
+        return bool(self.context.storage.get("info"))
+
+    def is_visible(self):
+        return True
+
+    def get_form(self, **kwargs):
+        return InfoForm(**kwargs)
+
+    def save(self, form):
+        self.context.storage["info"] = form.cleaned_data["info"]
+
+    def undo(self):
+        self.context.storage.pop("info", None)
+
+
+class ExtraStep(InfoStep):
+    identifier = "extra"
+    title = "Extra"
+    priority = 1
+    js_template_name = "shuup_onboarding_tests/step_js.jinja"
+
+    def is_done(self):
+        return bool(self.context.storage.get("extra"))
+
+    def save(self, form):
+        self.context.storage["extra"] = form.cleaned_data["info"]
+
+    def undo(self):
+        self.context.storage.pop("extra", None)
+
+
+class NoIdentifierStep(InfoStep):
+    identifier = ""
+
+
+class NoTemplateStep(InfoStep):
+    template_name = ""
+
+
+class BrokenTemplateStep(InfoStep):
+    template_name = "shuup_onboarding_tests/broken_step.jinja"
+
+
+class NotAStep:
+    identifier = "not_a_step"
+    template_name = "shuup_onboarding_tests/step.jinja"
+
+
+class PreparedStep(ExtraStep):
+    identifier = "prepared"
+    title = "Prepared"
+    prepare_render_context = True
+    render_calls = []
+
+    def get_render_context(self):
+        self.render_calls.append(self.context)
+        return {
+            "info": "prepared-{}".format(len(self.render_calls)),
+            "shop_id": (self.context.shop.pk if self.context.shop else None)
+        }
+
+    def get_render_context_key(self):
+        return self.context.storage.get("extra")
@@ -10,6 +10,7 @@ from shuup_workbench.test_settings import *  # noqa
 
 INSTALLED_APPS = list(locals().get('INSTALLED_APPS', [])) + [
     'shuup_onboarding',
+    'shuup_onboarding_tests',
 ]
 
 DATABASES = {
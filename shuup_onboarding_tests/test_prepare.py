@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+from concurrent.futures import Future
+
+import pytest
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
+from shuup.apps.provides import override_provides
+from shuup.testing.factories import get_default_shop
+
+from shuup_onboarding import prepare
+from shuup_onboarding.onboard import OnboardingContext
+from shuup_onboarding.storage import OnboardingSessionStorage
+from shuup_onboarding_tests.onboarding_steps import PreparedStep
+
+PROCESS_ID = "test_process"
+SESSION_KEY = "test-session"
+
+
+class SyncExecutor:
+    """
+    Runs the jobs right away, in the calling thread
+    """
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class QueueExecutor:
+    """
+    Never runs the jobs, they stay queued
+    """
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture(autouse=True)
+def clean_prepare():
+    cache.clear()
+    prepare._pending.clear()
+    PreparedStep.render_calls.clear()
+    yield
+    prepare._pending.clear()
+
+
+@pytest.fixture
+def sync_executor(monkeypatch):
+    executor = SyncExecutor()
+    monkeypatch.setattr(prepare, "_get_executor", lambda: executor)
+    return executor
+
+
+@pytest.fixture
+def queue_executor(monkeypatch):
+    executor = QueueExecutor()
+    monkeypatch.setattr(prepare, "_get_executor", lambda: executor)
+    return executor
+
+
+def _get_step(storage, shop=None):
+    return PreparedStep(OnboardingContext(storage=storage, shop=shop))
+
+
+@pytest.mark.django_db
+def test_prepared_render_context_hit(sync_executor):
+    shop = get_default_shop()
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+    storage["extra"] = "value"
+
+    prepare.prepare_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage, shop))
+    assert len(PreparedStep.render_calls) == 1
+
+    # computed from a copy of the step context
+    prepared_context = PreparedStep.render_calls[0]
+    assert prepared_context.storage is not storage
+    assert prepared_context.storage.get("extra") == "value"
+    assert prepared_context.shop == shop
+
+    # the next request uses the prepared render context
+    render_context = prepare.get_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage, shop))
+    assert render_context == {"info": "prepared-1", "shop_id": shop.pk}
+    assert len(PreparedStep.render_calls) == 1
+
+    # which is used only once
+    prepare.get_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage, shop))
+    assert len(PreparedStep.render_calls) == 2
+
+
+def test_prepared_render_context_miss_after_storage_change(sync_executor):
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+    prepare.prepare_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage))
+
+    storage["extra"] = "changed"
+    render_context = prepare.get_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage))
+    assert render_context["info"] == "prepared-2"
+
+    # other session
+    prepare.prepare_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage))
+    render_context = prepare.get_render_context(PROCESS_ID, "other-session", _get_step(storage))
+    assert render_context["info"] == "prepared-4"
+
+
+def test_prepared_render_context_failure(sync_executor, monkeypatch):
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+
+    def fail(self):
+        raise ValueError("Unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(PreparedStep, "get_render_context", fail)
+        prepare.prepare_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage))
+
+    assert not prepare._pending
+    render_context = prepare.get_render_context(PROCESS_ID, SESSION_KEY, _get_step(storage))
+    assert render_context["info"] == "prepared-1"
+
+
+def test_prepare_queue_limit(queue_executor, settings):
+    settings.SHUUP_ONBOARDING_PREPARE_QUEUE_LIMIT = 2
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+
+    for session_key in ["session-1", "session-2", "session-3"]:
+        prepare.prepare_render_context(PROCESS_ID, session_key, _get_step(storage))
+
+    # same data, already queued
+    prepare.prepare_render_context(PROCESS_ID, "session-3", _get_step(storage))
+    assert len(queue_executor.futures) == 3
+
+    first, second, third = queue_executor.futures
+    assert first.cancelled()
+    assert not second.cancelled()
+    assert not third.cancelled()
+    assert len(prepare._pending) == 2
+
+    # data changed, the queued job is replaced
+    storage["extra"] = "changed"
+    prepare.prepare_render_context(PROCESS_ID, "session-3", _get_step(storage))
+    assert third.cancelled()
+    assert len(queue_executor.futures) == 4
+
+    # not ready yet, computed in the request
+    render_context = prepare.get_render_context(PROCESS_ID, "session-2", _get_step(storage))
+    assert render_context["info"] == "prepared-1"
+    assert second.cancelled()
+    assert len(prepare._pending) == 1
+
+
+def test_step_not_prepared(queue_executor):
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+    step = _get_step(storage)
+    step.prepare_render_context = False
+
+    prepare.prepare_render_context(PROCESS_ID, SESSION_KEY, step)
+    assert not queue_executor.futures
+
+
+@pytest.mark.django_db
+def test_view_uses_prepared_render_context(admin_client, sync_executor):
+    get_default_shop()
+    url = reverse("shuup_admin:onboarding.onboard", kwargs=dict(process_id=PROCESS_ID))
+    steps = [
+        "shuup_onboarding_tests.onboarding_steps.InfoStep",
+        "shuup_onboarding_tests.onboarding_steps.PreparedStep",
+    ]
+
+    with override_provides("onboarding_process:{}".format(PROCESS_ID), steps):
+        # the next step is prepared while the user is on the first one
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert len(PreparedStep.render_calls) == 1
+
+        response = admin_client.post(url, data={"info": "my info"})
+        assert response.status_code == 200
+        content = response.content.decode("utf-8")
+        assert PreparedStep.title in content
+        assert '<div class="test-step">prepared-1</div>' in content
+        assert len(PreparedStep.render_calls) == 1
+
+
+def test_storage_revision():
+    storage = OnboardingSessionStorage(PROCESS_ID, SessionBase())
+    assert storage.get_revision() == 0
+
+    storage["extra"] = {"city": "x"}
+    assert storage.get_revision() == 1
+
+    # nothing to remove, nothing changed
+    assert storage.pop("missing", "default") == "default"
+    assert storage.get_revision() == 1
+
+    assert storage.pop("extra") == {"city": "x"}
+    assert storage.get_revision() == 2
+
+    storage.clear()
+    assert storage.get_revision() == 3
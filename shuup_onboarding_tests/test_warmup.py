@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup Onboarding
+#
+# Copyright (c) 2020 Christian Hess
+#
+# This source code is licensed under the OSL version 3.0 found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from shuup.apps.provides import override_provides
+
+from shuup_onboarding import warmup
+
+PROCESS_CATEGORY = "onboarding_process:test_process"
+
+
+def test_warm_up_valid_process():
+    assert warmup.warm_up_onboarding() == {"test_process": 2}
+
+
+@pytest.mark.parametrize("step_spec, message", [
+    ("shuup_onboarding_tests.onboarding_steps.NotAStep", "is not an `OnboardingStep` subclass"),
+    ("shuup_onboarding_tests.onboarding_steps.NoIdentifierStep", "has no identifier"),
+    ("shuup_onboarding_tests.onboarding_steps.NoTemplateStep", "has no template_name"),
+    ("shuup_onboarding_tests.onboarding_steps.BrokenTemplateStep", "Failed to compile onboarding template"),
+    ("shuup_onboarding_tests.onboarding_steps.MissingStep", "Failed to load the steps provided by"),
+    ("shuup_onboarding_tests.missing_module.MissingStep", "Failed to load the steps provided by"),
+])
+def test_warm_up_broken_step(step_spec, message):
+    with override_provides(PROCESS_CATEGORY, [step_spec]):
+        with pytest.raises(ImproperlyConfigured) as exc:
+            warmup.warm_up_onboarding()
+
+    assert message in str(exc.value)
+    if "provided by" in message:
+        assert PROCESS_CATEGORY in str(exc.value)
+
+
+@pytest.mark.parametrize("warm_up_on_ready", [True, False])
+def test_app_ready_warm_up(settings, monkeypatch, warm_up_on_ready):
+    calls = []
+    monkeypatch.setattr(warmup, "warm_up_onboarding", lambda: calls.append(True))
+    settings.SHUUP_ONBOARDING_WARM_UP_ON_READY = warm_up_on_ready
+
+    apps.get_app_config("shuup_onboarding").ready()
+    assert bool(calls) == warm_up_on_ready